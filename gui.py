@@ -1,5 +1,7 @@
 import sys
 import math
+from collections import OrderedDict
+
 import pygame
 
 from logic import (
@@ -17,10 +19,18 @@ WINDOW_WIDTH = 960
 WINDOW_HEIGHT = 600
 BACKGROUND_COLOR = (255, 255, 255)  # white
 TARGET_FPS = 120
+# Redraw and present only the regions that changed since the last frame;
+# set to False to repaint and flip the whole window every frame
+DIRTY_RECT_RENDERING = True
 
 # Start with this many random balls
 INITIAL_BALL_COUNT = 60
 
+# Ball sprites: 0..255 color channels are bucketed in steps of this size
+# (32 levels) and the least recently used sprites are evicted past the cache size
+BALL_COLOR_BUCKET = 8
+BALL_SPRITE_CACHE_SIZE = 512
+
 # Suction visuals and parameters
 SUCTION_RADIUS = 100.0
 SUCTION_COLOR = (40, 120, 255)
@@ -36,6 +46,17 @@ DELETION_BORDER = (220, 30, 30)
 SPIT_COUNT = 3
 SPIT_SPEED = 320.0
 
+# Only these events are let into the SDL queue; everything else (notably the
+# stream of mouse-motion events) is dropped before it becomes a Python object
+HANDLED_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+)
+
 
 def rgb_float_to_int(c):
     r = max(0, min(255, int(round(c[0] * 255))))
@@ -44,6 +65,27 @@ def rgb_float_to_int(c):
     return (r, g, b)
 
 
+_BALL_SPRITES = OrderedDict()
+
+
+def get_ball_sprite(radius, color):
+    """Return a cached pre-rendered circle sprite for an integer radius and 0..255 RGB color."""
+    step = BALL_COLOR_BUCKET
+    key = (radius, color[0] // step, color[1] // step, color[2] // step)
+    sprite = _BALL_SPRITES.get(key)
+    if sprite is not None:
+        _BALL_SPRITES.move_to_end(key)
+        return sprite
+    rgb = tuple(min(255, level * step + step // 2) for level in key[1:])
+    sprite = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (*rgb, 255), (radius, radius), radius)
+    sprite = sprite.convert_alpha()
+    _BALL_SPRITES[key] = sprite
+    if len(_BALL_SPRITES) > BALL_SPRITE_CACHE_SIZE:
+        _BALL_SPRITES.popitem(last=False)
+    return sprite
+
+
 def make_world():
     # You can tweak boundary to "wrap" or "bounce"
     cfg = WorldConfig(
@@ -61,27 +103,63 @@ def make_world():
     return world
 
 
+_SUCTION_SPRITE = None
+_DELETION_SPRITE = None
+
+
+def build_overlay_sprites():
+    """
+    Pre-render the suction and deletion zone overlays; their geometry never changes.
+
+    Must run after the display mode is set so the sprites can be converted to its format.
+    """
+    global _SUCTION_SPRITE, _DELETION_SPRITE
+    r = int(SUCTION_RADIUS)
+    sprite = pygame.Surface((2 * r + 4, 2 * r + 4), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (*SUCTION_COLOR, SUCTION_ALPHA), (r + 2, r + 2), r, 0)
+    pygame.draw.circle(sprite, SUCTION_COLOR, (r + 2, r + 2), r, 2)
+    _SUCTION_SPRITE = sprite.convert_alpha()
+
+    _, _, w, h = DELETION_ZONE
+    sprite = pygame.Surface((w, h), pygame.SRCALPHA)
+    sprite.fill((*DELETION_COLOR_FILL, DELETION_ALPHA))
+    pygame.draw.rect(sprite, DELETION_BORDER, pygame.Rect(0, 0, w, h), 2)
+    _DELETION_SPRITE = sprite.convert_alpha()
+
+
 def draw_suction(surface, pos):
-    overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-    pygame.draw.circle(overlay, (*SUCTION_COLOR, SUCTION_ALPHA), (int(pos[0]), int(pos[1])), int(SUCTION_RADIUS), 0)
-    pygame.draw.circle(overlay, SUCTION_COLOR, (int(pos[0]), int(pos[1])), int(SUCTION_RADIUS), 2)
-    surface.blit(overlay, (0, 0))
+    r = int(SUCTION_RADIUS)
+    return surface.blit(_SUCTION_SPRITE, (int(pos[0]) - r - 2, int(pos[1]) - r - 2))
 
 
 def draw_deletion_zone(surface):
-    x, y, w, h = DELETION_ZONE
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-    overlay.fill((*DELETION_COLOR_FILL, DELETION_ALPHA))
-    surface.blit(overlay, (x, y))
-    pygame.draw.rect(surface, DELETION_BORDER, pygame.Rect(x, y, w, h), 2)
+    x, y, _, _ = DELETION_ZONE
+    return surface.blit(_DELETION_SPRITE, (x, y))
+
+
+def build_background():
+    """Static scene layer (background color + deletion zone) used to erase dirty regions."""
+    background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    background.fill(BACKGROUND_COLOR)
+    draw_deletion_zone(background)
+    return background
 
 
 def run():
     pygame.init()
     try:
-        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF)
         pygame.display.set_caption("Ball World")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+        build_overlay_sprites()
+        background = build_background()
         clock = pygame.time.Clock()
+        hud_font = pygame.font.SysFont(None, 20)
+        # HUD: static instructions rendered once; inventory text only when the count changes
+        hint_surf = hud_font.render("LMB: vacuum | RMB drag+release: spit x3", True, (60, 60, 60)).convert_alpha()
+        inv_count = None
+        inv_surf = None
 
         world = make_world()
 
@@ -91,18 +169,26 @@ def run():
         # For right-click spit direction: aim from press to release
         rmb_down = False
         rmb_down_pos = (0.0, 0.0)
+        # Spit requests collected from input events, handed to this frame's sim step
+        pending_spits = []
+
+        # Screen regions drawn last frame; they are erased and re-presented this frame
+        prev_rects = []
+        full_redraw = True
 
         running = True
         while running:
             dt = clock.tick(TARGET_FPS) / 1000.0
 
             # --- Input handling ---
-            for event in pygame.event.get():
+            for event in pygame.event.get(eventtype=HANDLED_EVENTS):
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    full_redraw = True
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # LMB: start suction
                         sucking_enabled = True
@@ -123,59 +209,74 @@ def run():
 
                         # Queue spit request from pointer release position
                         # toward drag direction
-                        spit_req = {
-                            "count": SPIT_COUNT,
-                            "position": (float(release_pos[0]), float(release_pos[1])),
-                            "direction": (float(dx), float(dy)),
-                            "speed": SPIT_SPEED,
-                        }
-
-                        inputs = InputState(
-                            pointer=(float(release_pos[0]), float(release_pos[1])),
-                            sucking_enabled=False,
-                            suction_radius=SUCTION_RADIUS,
-                            spit_requests=[spit_req],
+                        pending_spits.append(
+                            {
+                                "count": SPIT_COUNT,
+                                "position": (float(release_pos[0]), float(release_pos[1])),
+                                "direction": (float(dx), float(dy)),
+                                "speed": SPIT_SPEED,
+                            }
                         )
-                        world.step(dt=0.0, inputs=inputs)  # process spit immediately this frame
 
             pointer_pos = pygame.mouse.get_pos()
 
             # --- Build input state for this frame ---
+            # Spits are processed first within step(), so they still land this frame
             inputs = InputState(
                 pointer=(float(pointer_pos[0]), float(pointer_pos[1])),
                 sucking_enabled=bool(sucking_enabled),
                 suction_radius=SUCTION_RADIUS,
-                spit_requests=[],
+                spit_requests=pending_spits,
             )
+            pending_spits = []
 
             # --- Sim step ---
             world.step(dt, inputs)
 
             # --- Render ---
-            screen.fill(BACKGROUND_COLOR)
-
-            # Deletion zone
-            draw_deletion_zone(screen)
-
-            # Balls
-            for b in world.balls:
-                color = rgb_float_to_int(b.color)
-                pygame.draw.circle(screen, color, (int(b.position[0]), int(b.position[1])), int(b.radius))
+            dirty = DIRTY_RECT_RENDERING and not full_redraw
+            if dirty:
+                # Erase last frame's drawings by restoring the static background under them
+                for rect in prev_rects:
+                    screen.blit(background, rect, rect)
+            else:
+                # Background + deletion zone
+                screen.blit(background, (0, 0))
+
+            # Balls: read the SoA columns directly instead of materializing Ball objects,
+            # and draw them all with a single blits() call from cached sprites
+            arrays = world.arrays
+            n = arrays.count
+            ball_blits = []
+            for x, y, r, c in zip(
+                arrays.px[:n].tolist(),
+                arrays.py[:n].tolist(),
+                arrays.radius[:n].tolist(),
+                arrays.color[:n].tolist(),
+            ):
+                r = int(r)
+                ball_blits.append((get_ball_sprite(r, c), (int(x) - r, int(y) - r)))
+            cur_rects = screen.blits(ball_blits)
 
             # Suction overlay
             if sucking_enabled and pointer_pos is not None:
-                draw_suction(screen, pointer_pos)
+                cur_rects.append(draw_suction(screen, pointer_pos))
 
             # HUD: inventory count
-            font = pygame.font.SysFont(None, 20)
-            inv_text = font.render(f"Inventory: {len(world.inventory)}", True, (30, 30, 30))
-            screen.blit(inv_text, (10, 8))
+            if len(world.inventory) != inv_count:
+                inv_count = len(world.inventory)
+                inv_surf = hud_font.render(f"Inventory: {inv_count}", True, (30, 30, 30)).convert_alpha()
+            cur_rects.append(screen.blit(inv_surf, (10, 8)))
 
             # HUD: instructions
-            hint = font.render("LMB: vacuum | RMB drag+release: spit x3", True, (60, 60, 60))
-            screen.blit(hint, (10, 30))
-
-            pygame.display.flip()
+            cur_rects.append(screen.blit(hint_surf, (10, 30)))
+
+            if dirty:
+                pygame.display.update(prev_rects + cur_rects)
+            else:
+                pygame.display.flip()
+            prev_rects = cur_rects
+            full_redraw = False
     finally:
         pygame.quit()
 
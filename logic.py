@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Deque, List, Tuple, Optional, Dict, Any
 import math
 import random
 
+import numpy as np
+
+from logic_kernels import (
+    NUMBA_AVAILABLE,
+    apply_suction_and_capture as _suction_capture_kernel,
+    integrate as _integrate_kernel,
+)
+
 
 # ===============
 # Public data API
@@ -40,7 +50,7 @@ class Ball:
 class WorldConfig:
     width: float
     height: float
-    # Boundary behavior: "wrap" or "bounce"
+    # Boundary behavior: "wrap" or "bounce" (resolved once when the world is built)
     boundary: str = "wrap"
     # Global damping applied to velocity each second (0..1, 0 = no damping)
     linear_damping: float = 0.0
@@ -76,6 +86,207 @@ class WorldEvents:
         self.events.append({"type": type_, **payload})
 
 
+class BallArray:
+    """
+    Structure-of-arrays storage for balls.
+
+    Every ball attribute lives in its own NumPy column so the simulation can
+    operate on whole columns at once. Columns are pre-allocated to `capacity`
+    rows and only the first `count` rows are live; capacity doubles on overflow.
+    Colors are stored as uint8 RGB rows and converted to/from the float `Color`
+    API at the edges.
+    """
+
+    _COLUMNS = ("px", "py", "vx", "vy", "radius", "color", "mass", "ids")
+
+    def __init__(self, capacity: int = 64) -> None:
+        capacity = max(1, int(capacity))
+        self.count = 0
+        self.px = np.zeros(capacity, dtype=np.float64)
+        self.py = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.mass = np.zeros(capacity, dtype=np.float64)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        return self.px.shape[0]
+
+    def reserve(self, extra: int) -> None:
+        """Ensure room for `extra` more balls with at most one reallocation."""
+        needed = self.count + extra
+        if needed > self.capacity:
+            capacity = max(self.capacity, 4)
+            while capacity < needed:
+                capacity *= 2
+            self._grow(capacity)
+
+    def append(self, ball: Ball) -> int:
+        """Store `ball` in the next free row and return its index."""
+        if self.count >= self.capacity:
+            self._grow(max(2 * self.capacity, 8))
+        i = self.count
+        self.px[i], self.py[i] = ball.position
+        self.vx[i], self.vy[i] = ball.velocity
+        self.radius[i] = ball.radius
+        self.color[i] = _color_to_u8(ball.color)
+        self.mass[i] = ball.mass
+        self.ids[i] = ball.id
+        self.count += 1
+        return i
+
+    def get(self, i: int) -> Ball:
+        """Synthesize a detached `Ball` from row `i`."""
+        return Ball(
+            id=int(self.ids[i]),
+            position=(float(self.px[i]), float(self.py[i])),
+            velocity=(float(self.vx[i]), float(self.vy[i])),
+            radius=float(self.radius[i]),
+            color=_u8_to_color(self.color[i]),
+            mass=float(self.mass[i]),
+        )
+
+    def index_of(self, ball_id: int) -> Optional[int]:
+        hits = np.flatnonzero(self.ids[: self.count] == ball_id)
+        return int(hits[0]) if hits.size else None
+
+    def keep(self, mask: np.ndarray) -> None:
+        """
+        Drop every live row where `mask` is False, preserving order.
+
+        Survivors are compacted to the front of the existing buffers, so the
+        allocated capacity is kept for balls added later.
+        """
+        n = self.count
+        m = int(np.count_nonzero(mask))
+        if m == n:
+            return
+        for name in self._COLUMNS:
+            col = getattr(self, name)
+            col[:m] = col[:n][mask]
+        self.count = m
+
+    def _grow(self, capacity: int) -> None:
+        n = self.count
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, name, new)
+
+
+class BallRef:
+    """
+    Live handle to one ball stored in a `BallArray`, with the same attributes as `Ball`.
+
+    Reads and writes go straight to the array columns, so assigning
+    `ref.position = (x, y)` is two in-place float stores. The handle remembers
+    the ball id alongside its row: if removals have compacted the ball into
+    another row it is found again, and while the ball is not in the world (deleted,
+    removed, or sitting in the inventory) any access raises `LookupError`.
+    Use `copy()` to keep a detached snapshot.
+    """
+
+    __slots__ = ("_arrays", "_index", "_id")
+
+    def __init__(self, arrays: BallArray, index: int) -> None:
+        self._arrays = arrays
+        self._index = index
+        self._id = int(arrays.ids[index])
+
+    def _row(self) -> int:
+        a = self._arrays
+        i = self._index
+        if i < a.count and a.ids[i] == self._id:
+            return i
+        i = a.index_of(self._id)
+        if i is None:
+            raise LookupError(f"ball {self._id} is no longer in the world")
+        self._index = i
+        return i
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @property
+    def position(self) -> Vec2:
+        i = self._row()
+        return float(self._arrays.px[i]), float(self._arrays.py[i])
+
+    @position.setter
+    def position(self, value: Vec2) -> None:
+        i = self._row()
+        self._arrays.px[i], self._arrays.py[i] = value
+
+    @property
+    def velocity(self) -> Vec2:
+        i = self._row()
+        return float(self._arrays.vx[i]), float(self._arrays.vy[i])
+
+    @velocity.setter
+    def velocity(self, value: Vec2) -> None:
+        i = self._row()
+        self._arrays.vx[i], self._arrays.vy[i] = value
+
+    @property
+    def radius(self) -> float:
+        return float(self._arrays.radius[self._row()])
+
+    @radius.setter
+    def radius(self, value: float) -> None:
+        self._arrays.radius[self._row()] = value
+
+    @property
+    def color(self) -> Color:
+        return _u8_to_color(self._arrays.color[self._row()])
+
+    @color.setter
+    def color(self, value: Color) -> None:
+        self._arrays.color[self._row()] = _color_to_u8(value)
+
+    @property
+    def mass(self) -> float:
+        return float(self._arrays.mass[self._row()])
+
+    @mass.setter
+    def mass(self, value: float) -> None:
+        self._arrays.mass[self._row()] = value
+
+    def copy(self) -> Ball:
+        return self._arrays.get(self._row())
+
+
+class _BallView(Sequence):
+    """Read-only sequence of live `BallRef` handles into a `BallArray`."""
+
+    def __init__(self, arrays: BallArray) -> None:
+        self._arrays = arrays
+
+    def __len__(self) -> int:
+        return self._arrays.count
+
+    def __getitem__(self, index):  # type: ignore[override]
+        n = self._arrays.count
+        if isinstance(index, slice):
+            return [BallRef(self._arrays, i) for i in range(*index.indices(n))]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("ball index out of range")
+        return BallRef(self._arrays, index)
+
+    def __iter__(self):
+        for i in range(self._arrays.count):
+            yield BallRef(self._arrays, i)
+
+
 class BallWorld:
     """
     Pure game-logic world for balls. No rendering or I/O.
@@ -90,6 +301,8 @@ class BallWorld:
     External integration:
     - Use `step(dt, inputs)` each frame
     - Query `balls`, `inventory`, and the returned `WorldEvents` for UI updates
+    - Hot paths (e.g. rendering) can read the `arrays` columns directly instead
+      of going through the per-ball `BallRef` handles in `balls`
     """
 
     def __init__(self, config: WorldConfig, rng_seed: Optional[int] = None) -> None:
@@ -97,18 +310,27 @@ class BallWorld:
         self._rng = random.Random(rng_seed)
         self._next_id = 1
         self._deletion_zone: Optional[Rect] = None
-        self._balls: List[Ball] = []
-        self._inventory: List[Ball] = []
+        self._arrays = BallArray()
+        self._inventory: Deque[Ball] = deque()
+        # Boundary mode is fixed at construction; unknown modes clamp silently
+        self._boundary_fn = {
+            "wrap": self._boundary_wrap,
+            "bounce": self._boundary_bounce,
+        }.get(config.boundary, self._boundary_clamp)
 
     # -------------
     # Public access
     # -------------
     @property
-    def balls(self) -> List[Ball]:
-        return self._balls
+    def balls(self) -> Sequence[BallRef]:
+        return _BallView(self._arrays)
 
     @property
-    def inventory(self) -> List[Ball]:
+    def arrays(self) -> BallArray:
+        return self._arrays
+
+    @property
+    def inventory(self) -> Deque[Ball]:
         return self._inventory
 
     def set_deletion_zone(self, rect: Optional[Rect]) -> None:
@@ -123,20 +345,23 @@ class BallWorld:
         velocity: Vec2 = (0.0, 0.0),
         mass: float = 1.0,
         ball_id: Optional[int] = None,
-    ) -> Ball:
+    ) -> BallRef:
         if ball_id is None:
             ball_id = self._next_and_increment_id()
         ball = Ball(ball_id, position, velocity, radius, _clamp_color(color), mass)
-        self._balls.append(ball)
-        return ball
+        return BallRef(self._arrays, self._arrays.append(ball))
 
     def remove_ball_by_id(self, ball_id: int) -> Optional[Ball]:
-        for i, b in enumerate(self._balls):
-            if b.id == ball_id:
-                return self._balls.pop(i)
-        return None
+        i = self._arrays.index_of(ball_id)
+        if i is None:
+            return None
+        ball = self._arrays.get(i)
+        keep = np.ones(self._arrays.count, dtype=bool)
+        keep[i] = False
+        self._arrays.keep(keep)
+        return ball
 
-    def add_random_ball(self, radius_range: Tuple[float, float] = (8.0, 16.0)) -> Ball:
+    def add_random_ball(self, radius_range: Tuple[float, float] = (8.0, 16.0)) -> BallRef:
         r = self._rng.uniform(*radius_range)
         x = self._rng.uniform(r, self.config.width - r)
         y = self._rng.uniform(r, self.config.height - r)
@@ -159,15 +384,16 @@ class BallWorld:
             # Prevent re-processing if the same InputState instance is reused
             inputs.spit_requests.clear()
 
-        # 2) Apply suction forces if enabled
+        # 2) Pointer vacuum: capture balls close enough into inventory and
+        #    apply suction forces to the rest, in a single pass
         if inputs.sucking_enabled and inputs.pointer is not None:
-            self._apply_suction(inputs.pointer, inputs.suction_radius, dt)
+            self._apply_suction_and_capture(inputs.pointer, inputs.suction_radius, dt, events)
 
         # 3) Integrate motion
         self._integrate(dt)
 
         # 4) Boundary handling
-        self._handle_boundaries()
+        self._boundary_fn()
 
         # 5) Deletion zone check
         self._apply_deletion_zone(events)
@@ -175,10 +401,6 @@ class BallWorld:
         # 6) Color mixing on contact (no repulsion)
         self._apply_color_mixing(events)
 
-        # 7) Capture into inventory if pointer vacuum is close enough
-        if inputs.sucking_enabled and inputs.pointer is not None:
-            self._capture_into_inventory(inputs.pointer, events)
-
         return events
 
     # -----------------
@@ -189,140 +411,182 @@ class BallWorld:
         self._next_id += 1
         return nid
 
-    def _apply_suction(self, pointer: Vec2, radius: float, dt: float) -> None:
+    def _apply_suction_and_capture(self, pointer: Vec2, radius: float, dt: float, events: WorldEvents) -> None:
+        """
+        One pass over the ball columns for the pointer vacuum: balls within the
+        capture distance go to the inventory, the others within `radius` are
+        pulled toward the pointer.
+        """
+        a = self._arrays
+        n = a.count
+        if n == 0:
+            return
         px, py = pointer
         strength = self.config.suction_strength
-        for b in self._balls:
-            bx, by = b.position
-            dx = px - bx
-            dy = py - by
-            dist = math.hypot(dx, dy)
-            if dist <= 1e-6 or dist > radius:
-                continue
-            nx = dx / dist
-            ny = dy / dist
-            # Force magnitude increases closer to center (inverse falloff)
-            falloff = max(0.05, 1.0 - dist / radius)
-            accel = strength * falloff
-            ax = nx * accel
-            ay = ny * accel
-            b.velocity = (b.velocity[0] + ax * dt, b.velocity[1] + ay * dt)
+        capture_dist = self.config.capture_distance
+        if NUMBA_AVAILABLE:
+            captured = np.empty(n, dtype=bool)
+            hits = _suction_capture_kernel(
+                a.px, a.py, a.vx, a.vy,
+                float(px), float(py), float(radius), float(strength), float(capture_dist), float(dt), n,
+                captured,
+            )
+        else:
+            dx = px - a.px[:n]
+            dy = py - a.py[:n]
+            # Range tests on squared distance; only balls being pulled pay for the sqrt
+            d2 = dx * dx + dy * dy
+            captured = d2 <= capture_dist * capture_dist
+            hits = int(np.count_nonzero(captured))
+            pulled = (d2 > 1e-12) & (d2 <= radius * radius) & ~captured
+            if pulled.any():
+                d = np.sqrt(d2[pulled])
+                # Force magnitude increases closer to center (inverse falloff)
+                falloff = np.maximum(0.05, 1.0 - d / radius)
+                scale = strength * falloff * dt / d
+                a.vx[:n][pulled] += dx[pulled] * scale
+                a.vy[:n][pulled] += dy[pulled] * scale
+        if hits == 0:
+            return
+        sucked = [a.get(i) for i in np.flatnonzero(captured).tolist()]
+        self._inventory.extend(sucked)
+        for ball in sucked:
+            events.emit("sucked", ball_id=ball.id)
+        a.keep(~captured)
 
     def _integrate(self, dt: float) -> None:
         gx, gy = self.config.gravity
         damping = self.config.linear_damping
         clamp_speed = self.config.max_speed
-        for b in self._balls:
-            vx = b.velocity[0] + gx * dt
-            vy = b.velocity[1] + gy * dt
-            if damping > 0.0:
-                damp = max(0.0, 1.0 - damping * dt)
-                vx *= damp
-                vy *= damp
-            if clamp_speed > 0.0:
-                speed = math.hypot(vx, vy)
-                if speed > clamp_speed:
-                    scale = clamp_speed / max(speed, 1e-6)
-                    vx *= scale
-                    vy *= scale
-            px = b.position[0] + vx * dt
-            py = b.position[1] + vy * dt
-            b.position = (px, py)
-            b.velocity = (vx, vy)
-
-    def _handle_boundaries(self) -> None:
+        a = self._arrays
+        n = a.count
+        if NUMBA_AVAILABLE:
+            _integrate_kernel(
+                a.px, a.py, a.vx, a.vy,
+                float(gx), float(gy), float(damping), float(clamp_speed), float(dt), n,
+            )
+            return
+        vx = a.vx[:n]
+        vy = a.vy[:n]
+        vx += gx * dt
+        vy += gy * dt
+        if damping > 0.0:
+            damp = max(0.0, 1.0 - damping * dt)
+            vx *= damp
+            vy *= damp
+        if clamp_speed > 0.0:
+            speed = np.hypot(vx, vy)
+            over = speed > clamp_speed
+            if over.any():
+                scale = clamp_speed / np.maximum(speed[over], 1e-6)
+                vx[over] *= scale
+                vy[over] *= scale
+        a.px[:n] += vx * dt
+        a.py[:n] += vy * dt
+
+    def _boundary_wrap(self) -> None:
         w, h = self.config.width, self.config.height
-        mode = self.config.boundary
-        if mode == "wrap":
-            for b in self._balls:
-                px, py = b.position
-                r = b.radius
-                # Wrap using radius as margin to keep center within bounds nicely
-                if px < -r:
-                    px = w + r
-                elif px > w + r:
-                    px = -r
-                if py < -r:
-                    py = h + r
-                elif py > h + r:
-                    py = -r
-                b.position = (px, py)
-        elif mode == "bounce":
-            for b in self._balls:
-                px, py = b.position
-                vx, vy = b.velocity
-                r = b.radius
-                if px - r < 0.0 and vx < 0.0:
-                    px = r
-                    vx *= -1.0
-                if px + r > w and vx > 0.0:
-                    px = w - r
-                    vx *= -1.0
-                if py - r < 0.0 and vy < 0.0:
-                    py = r
-                    vy *= -1.0
-                if py + r > h and vy > 0.0:
-                    py = h - r
-                    vy *= -1.0
-                b.position = (px, py)
-                b.velocity = (vx, vy)
-        else:
-            # Unknown mode: clamp silently
-            for b in self._balls:
-                px = min(max(b.radius, b.position[0]), w - b.radius)
-                py = min(max(b.radius, b.position[1]), h - b.radius)
-                b.position = (px, py)
+        a = self._arrays
+        n = a.count
+        px = a.px[:n]
+        py = a.py[:n]
+        r = a.radius[:n]
+        # Wrap using radius as margin to keep center within bounds nicely:
+        # each axis is periodic over [-r, size + r), done branch-free in place
+        np.add(px, r, out=px)
+        np.mod(px, w + 2.0 * r, out=px)
+        px -= r
+        np.add(py, r, out=py)
+        np.mod(py, h + 2.0 * r, out=py)
+        py -= r
+
+    def _boundary_bounce(self) -> None:
+        w, h = self.config.width, self.config.height
+        a = self._arrays
+        n = a.count
+        px = a.px[:n]
+        py = a.py[:n]
+        vx = a.vx[:n]
+        vy = a.vy[:n]
+        r = a.radius[:n]
+        hit = (px - r < 0.0) & (vx < 0.0)
+        px[hit] = r[hit]
+        vx[hit] *= -1.0
+        hit = (px + r > w) & (vx > 0.0)
+        px[hit] = w - r[hit]
+        vx[hit] *= -1.0
+        hit = (py - r < 0.0) & (vy < 0.0)
+        py[hit] = r[hit]
+        vy[hit] *= -1.0
+        hit = (py + r > h) & (vy > 0.0)
+        py[hit] = h - r[hit]
+        vy[hit] *= -1.0
+
+    def _boundary_clamp(self) -> None:
+        w, h = self.config.width, self.config.height
+        a = self._arrays
+        n = a.count
+        px = a.px[:n]
+        py = a.py[:n]
+        r = a.radius[:n]
+        px[:] = np.minimum(np.maximum(r, px), w - r)
+        py[:] = np.minimum(np.maximum(r, py), h - r)
 
     def _apply_deletion_zone(self, events: WorldEvents) -> None:
         if not self._deletion_zone:
             return
         x, y, w, h = self._deletion_zone
-        kept: List[Ball] = []
-        for b in self._balls:
-            bx, by = b.position
-            if x <= bx < x + w and y <= by < y + h:
-                events.emit("deleted", ball_id=b.id)
-                continue
-            kept.append(b)
-        self._balls = kept
+        a = self._arrays
+        n = a.count
+        px = a.px[:n]
+        py = a.py[:n]
+        inside = (px >= x) & (px < x + w) & (py >= y) & (py < y + h)
+        if not inside.any():
+            return
+        for ball_id in a.ids[:n][inside].tolist():
+            events.emit("deleted", ball_id=ball_id)
+        a.keep(~inside)
 
     def _apply_color_mixing(self, events: WorldEvents) -> None:
-        n = len(self._balls)
+        a = self._arrays
+        n = a.count
         if n <= 1:
             return
-        # Snapshot original colors so multiple collisions in the same frame
-        # use pre-collision colors instead of cascaded updates.
-        original_color_by_id = {b.id: b.color for b in self._balls}
-        for i in range(n):
-            bi = self._balls[i]
-            for j in range(i + 1, n):
-                bj = self._balls[j]
-                if _circles_touch(bi.position, bi.radius, bj.position, bj.radius):
-                    c_old_i = original_color_by_id.get(bi.id, bi.color)
-                    c_old_j = original_color_by_id.get(bj.id, bj.color)
-                    c_mix = vivid_color_mix(c_old_i, c_old_j)
-                    # Symmetric mixing; both adopt the mixed color
-                    bi.color = c_mix
-                    bj.color = c_mix
-                    events.emit(
-                        "mixed",
-                        ball_ids=(bi.id, bj.id),
-                        color_before=(c_old_i, c_old_j),
-                        color_after=c_mix,
-                    )
-
-    def _capture_into_inventory(self, pointer: Vec2, events: WorldEvents) -> None:
-        capture_dist = self.config.capture_distance
-        px, py = pointer
-        kept: List[Ball] = []
-        for b in self._balls:
-            bx, by = b.position
-            if math.hypot(px - bx, py - by) <= capture_dist:
-                self._inventory.append(b)
-                events.emit("sucked", ball_id=b.id)
-            else:
-                kept.append(b)
-        self._balls = kept
+        pair_i, pair_j = _touching_pairs(a.px[:n], a.py[:n], a.radius[:n])
+        if pair_i.size == 0:
+            return
+        # Snapshot original colors (only for balls in a pair) so multiple collisions
+        # in the same frame use pre-collision colors instead of cascaded updates.
+        old_i = a.color[pair_i]
+        old_j = a.color[pair_j]
+        # Average in uint8 space, widening first so the sum cannot overflow. Odd
+        # sums round half to even so repeated mixing does not drift darker.
+        total = old_i.astype(np.uint16) + old_j
+        half = total >> 1
+        mixed = (half + (total & half & 1)).astype(np.uint8)
+        # Symmetric mixing; both adopt the mixed color. Pairs are in (i, j)
+        # order, so each ball keeps the mix from the last pair it appears in.
+        order = np.arange(pair_i.size)
+        last = np.full(n, -1, dtype=np.int64)
+        np.maximum.at(last, pair_i, order)
+        np.maximum.at(last, pair_j, order)
+        touched = last >= 0
+        a.color[:n][touched] = mixed[last[touched]]
+
+        ids = a.ids[:n]
+        for id_i, id_j, c_old_i, c_old_j, c_mix in zip(
+            ids[pair_i].tolist(),
+            ids[pair_j].tolist(),
+            (old_i / 255.0).tolist(),
+            (old_j / 255.0).tolist(),
+            (mixed / 255.0).tolist(),
+        ):
+            events.emit(
+                "mixed",
+                ball_ids=(id_i, id_j),
+                color_before=(tuple(c_old_i), tuple(c_old_j)),
+                color_after=tuple(c_mix),
+            )
 
     def _handle_spit_request(self, req: Dict[str, Any], events: WorldEvents) -> None:
         count = int(max(1, req.get("count", 1)))
@@ -337,8 +601,10 @@ class BallWorld:
             mag = 1.0
         nx, ny = dx / mag, dy / mag
 
-        for _ in range(min(count, len(self._inventory))):
-            ball = self._inventory.pop(0)
+        count = min(count, len(self._inventory))
+        self._arrays.reserve(count)
+        for _ in range(count):
+            ball = self._inventory.popleft()
             # Slight positional jitter to avoid identical overlap
             jx = (self._rng.random() - 0.5) * ball.radius * 0.5
             jy = (self._rng.random() - 0.5) * ball.radius * 0.5
@@ -346,7 +612,7 @@ class BallWorld:
             vy = ny * speed + (self._rng.random() - 0.5) * 20.0
             ball.position = (pos[0] + jx, pos[1] + jy)
             ball.velocity = (vx, vy)
-            self._balls.append(ball)
+            self._arrays.append(ball)
             events.emit("spat", ball_id=ball.id, position=ball.position, velocity=ball.velocity)
 
 
@@ -355,11 +621,71 @@ class BallWorld:
 # ======================
 
 
-def _circles_touch(p1: Vec2, r1: float, p2: Vec2, r2: float) -> bool:
-    dx = p2[0] - p1[0]
-    dy = p2[1] - p1[1]
-    rr = r1 + r2
-    return (dx * dx + dy * dy) <= rr * rr
+# Half of the 3x3 neighbourhood (plus the cell itself) so each pair of cells is visited once
+_NEIGHBOR_OFFSETS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def _touching_pairs(px: np.ndarray, py: np.ndarray, radius: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return index arrays (i, j), i < j, of every pair of touching circles.
+
+    Broad phase is a uniform grid with cells of size 2 * max radius, so touching
+    circles always fall in the same or adjacent cells. Balls are sorted by cell
+    key and each neighbour cell is located with `searchsorted`; only those
+    candidates go through the exact distance test. Pairs come back sorted by (i, j).
+    """
+    n = px.shape[0]
+    empty = np.zeros(0, dtype=np.int64)
+    if n <= 1:
+        return empty, empty
+    cell_size = 2.0 * float(radius.max())
+    if cell_size <= 0.0:
+        cell_size = 1.0
+    cell_x = np.floor(px / cell_size).astype(np.int64)
+    cell_y = np.floor(py / cell_size).astype(np.int64)
+    cell_x -= cell_x.min()
+    # Keep one empty row on either side so y +/- 1 never aliases into another column
+    cell_y -= cell_y.min() - 1
+    stride = int(cell_y.max()) + 2
+    key = cell_x * stride + cell_y
+
+    order = np.argsort(key, kind="stable")
+    sorted_key = key[order]
+    ball = np.arange(n)
+
+    cand_i = []
+    cand_j = []
+    for ox, oy in _NEIGHBOR_OFFSETS:
+        target = key + (ox * stride + oy)
+        lo = np.searchsorted(sorted_key, target, side="left")
+        hi = np.searchsorted(sorted_key, target, side="right")
+        counts = hi - lo
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        # Expand each ball's [lo, hi) range of neighbours into flat candidate pairs
+        a = np.repeat(ball, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        b = order[np.repeat(lo, counts) + offsets]
+        if ox == 0 and oy == 0:
+            same = a < b
+            a = a[same]
+            b = b[same]
+        cand_i.append(a)
+        cand_j.append(b)
+    if not cand_i:
+        return empty, empty
+
+    a = np.concatenate(cand_i)
+    b = np.concatenate(cand_j)
+    dx = px[b] - px[a]
+    dy = py[b] - py[a]
+    rr = radius[a] + radius[b]
+    hit = (dx * dx + dy * dy) <= rr * rr
+    i = np.minimum(a[hit], b[hit])
+    j = np.maximum(a[hit], b[hit])
+    pair_order = np.lexsort((j, i))
+    return i[pair_order], j[pair_order]
 
 
 def _clamp_color(c: Color) -> Color:
@@ -370,6 +696,14 @@ def _clamp_color(c: Color) -> Color:
     )
 
 
+def _color_to_u8(c: Color) -> np.ndarray:
+    return np.clip(np.rint(np.asarray(c, dtype=np.float64) * 255.0), 0, 255).astype(np.uint8)
+
+
+def _u8_to_color(c: np.ndarray) -> Color:
+    return float(c[0]) / 255.0, float(c[1]) / 255.0, float(c[2]) / 255.0
+
+
 def vivid_color_mix(c1: Color, c2: Color) -> Color:
     """
     Universal mathematical mixing in RGB space.
@@ -383,50 +717,6 @@ def vivid_color_mix(c1: Color, c2: Color) -> Color:
     return _clamp_color((r, g, b))
 
 
-# -----------
-# HSL helpers
-# -----------
-
-
-def rgb_to_hsl(r: float, g: float, b: float) -> Tuple[float, float, float]:
-    mx = max(r, g, b)
-    mn = min(r, g, b)
-    l = (mx + mn) / 2.0
-    if mx == mn:
-        return 0.0, 0.0, l
-    d = mx - mn
-    s = d / (2.0 - mx - mn) if l > 0.5 else d / (mx + mn)
-    if mx == r:
-        h = ((g - b) / d + (6.0 if g < b else 0.0)) / 6.0
-    elif mx == g:
-        h = ((b - r) / d + 2.0) / 6.0
-    else:
-        h = ((r - g) / d + 4.0) / 6.0
-    return h % 1.0, s, l
-
-
-def hsl_to_rgb(h: float, s: float, l: float) -> Tuple[float, float, float]:
-    if s == 0.0:
-        return l, l, l
-
-    def hue_to_rgb(p: float, q: float, t: float) -> float:
-        t = t % 1.0
-        if t < 1 / 6:
-            return p + (q - p) * 6 * t
-        if t < 1 / 2:
-            return q
-        if t < 2 / 3:
-            return p + (q - p) * (2 / 3 - t) * 6
-        return p
-
-    q = l * (1 + s) if l < 0.5 else l + s - l * s
-    p = 2 * l - q
-    r = hue_to_rgb(p, q, h + 1 / 3)
-    g = hue_to_rgb(p, q, h)
-    b = hue_to_rgb(p, q, h - 1 / 3)
-    return r, g, b
-
-
 # ==================
 # Convenience factory
 # ==================
@@ -442,6 +732,8 @@ __all__ = [
     "Vec2",
     "Rect",
     "Ball",
+    "BallArray",
+    "BallRef",
     "WorldConfig",
     "InputState",
     "WorldEvents",
@@ -0,0 +1,79 @@
+"""
+Optional Numba-compiled kernels for the per-ball loops in `logic`.
+
+Kernels operate in place on the `BallArray` columns and only touch the first
+`n` rows. Numba is optional: without it the functions below are plain Python
+and `NUMBA_AVAILABLE` is False, in which case `logic` keeps using its NumPy
+column operations instead of calling them.
+"""
+
+from __future__ import annotations
+
+import math
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(fn):
+            return fn
+
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def integrate(px, py, vx, vy, gx, gy, damping, clamp, dt, n):
+    damp = max(0.0, 1.0 - damping * dt) if damping > 0.0 else 1.0
+    for i in range(n):
+        vxi = (vx[i] + gx * dt) * damp
+        vyi = (vy[i] + gy * dt) * damp
+        if clamp > 0.0:
+            speed = math.hypot(vxi, vyi)
+            if speed > clamp:
+                scale = clamp / max(speed, 1e-6)
+                vxi *= scale
+                vyi *= scale
+        vx[i] = vxi
+        vy[i] = vyi
+        px[i] += vxi * dt
+        py[i] += vyi * dt
+
+
+@njit(cache=True, fastmath=True)
+def apply_suction_and_capture(px, py, vx, vy, ptx, pty, radius, strength, capture_dist, dt, n, captured):
+    """Flag balls within `capture_dist` in `captured`, pull the rest; return the capture count."""
+    r2 = radius * radius
+    c2 = capture_dist * capture_dist
+    hits = 0
+    for i in range(n):
+        dx = ptx - px[i]
+        dy = pty - py[i]
+        d2 = dx * dx + dy * dy
+        if d2 <= c2:
+            captured[i] = True
+            hits += 1
+            continue
+        captured[i] = False
+        if d2 <= 1e-12 or d2 > r2:
+            continue
+        dist = math.sqrt(d2)
+        # Force magnitude increases closer to center (inverse falloff)
+        falloff = max(0.05, 1.0 - dist / radius)
+        scale = strength * falloff * dt / dist
+        vx[i] += dx * scale
+        vy[i] += dy * scale
+    return hits
+
+
+__all__ = [
+    "NUMBA_AVAILABLE",
+    "integrate",
+    "apply_suction_and_capture",
+]